@@ -14,14 +14,29 @@ import sys
 import json
 import math
 import time
+import queue
+import atexit
+import socket
+import logging
+import logging.handlers
 import argparse
+import threading
+from collections import deque
+from types import MappingProxyType
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 # Force line-buffered stdout for non-TTY environments (cron, Docker, Railway)
 sys.stdout.reconfigure(line_buffering=True)
 
+log = logging.getLogger("fastloop")
+
 # Optional: Trade Journal integration
 try:
     from tradejournal import log_trade
@@ -35,27 +50,108 @@ except ImportError:
         def log_trade(*args, **kwargs):
             pass
 
+# Optional: orjson for faster JSON encode/decode (falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+# Optional: Binance WebSocket kline stream (falls back to REST polling)
+try:
+    from websockets.sync.client import connect as ws_connect
+    WS_AVAILABLE = True
+except ImportError:
+    WS_AVAILABLE = False
+
+# Optional: Numba JIT for the candle reduction (falls back to plain NumPy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
 # =============================================================================
 # Configuration (env vars > defaults)
 # =============================================================================
-ENTRY_THRESHOLD = float(os.environ.get("SIMMER_SPRINT_ENTRY", 0.05))
-MIN_MOMENTUM_PCT = float(os.environ.get("SIMMER_SPRINT_MOMENTUM", 0.5))
-MAX_POSITION_USD = float(os.environ.get("SIMMER_SPRINT_MAX_POSITION", 5.0))
-SIGNAL_SOURCE = os.environ.get("SIMMER_SPRINT_SIGNAL", "binance")
-LOOKBACK_MINUTES = int(os.environ.get("SIMMER_SPRINT_LOOKBACK", 5))
-MIN_TIME_REMAINING = int(os.environ.get("SIMMER_SPRINT_MIN_TIME", 60))
-ASSET = os.environ.get("SIMMER_SPRINT_ASSET", "BTC").upper()
-WINDOW = os.environ.get("SIMMER_SPRINT_WINDOW", "5m")
-VOLUME_CONFIDENCE = os.environ.get("SIMMER_SPRINT_VOL_CONF", "true").lower() in ("true", "1", "yes")
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Strategy settings, read once from the environment and immutable afterwards."""
+    entry_threshold: float
+    min_momentum_pct: float
+    max_position_usd: float
+    signal_source: str
+    lookback_minutes: int
+    min_time_remaining: int
+    asset: str
+    window: str
+    volume_confidence: bool
+
+    @classmethod
+    def from_env(cls, env=os.environ):
+        return cls(
+            entry_threshold=float(env.get("SIMMER_SPRINT_ENTRY", 0.05)),
+            min_momentum_pct=float(env.get("SIMMER_SPRINT_MOMENTUM", 0.5)),
+            max_position_usd=float(env.get("SIMMER_SPRINT_MAX_POSITION", 5.0)),
+            signal_source=env.get("SIMMER_SPRINT_SIGNAL", "binance"),
+            lookback_minutes=int(env.get("SIMMER_SPRINT_LOOKBACK", 5)),
+            min_time_remaining=int(env.get("SIMMER_SPRINT_MIN_TIME", 60)),
+            asset=env.get("SIMMER_SPRINT_ASSET", "BTC").upper(),
+            window=env.get("SIMMER_SPRINT_WINDOW", "5m"),
+            volume_confidence=env.get("SIMMER_SPRINT_VOL_CONF", "true").lower() in ("true", "1", "yes"),
+        )
+
+SETTINGS = Settings.from_env()
+
+# Module-level aliases kept for existing callers
+ENTRY_THRESHOLD = SETTINGS.entry_threshold
+MIN_MOMENTUM_PCT = SETTINGS.min_momentum_pct
+MAX_POSITION_USD = SETTINGS.max_position_usd
+SIGNAL_SOURCE = SETTINGS.signal_source
+LOOKBACK_MINUTES = SETTINGS.lookback_minutes
+MIN_TIME_REMAINING = SETTINGS.min_time_remaining
+ASSET = SETTINGS.asset
+WINDOW = SETTINGS.window
+VOLUME_CONFIDENCE = SETTINGS.volume_confidence
 
 TRADE_SOURCE = "sdk:fastloop"
 SMART_SIZING_PCT = 0.05
 MIN_SHARES_PER_ORDER = 5
 
-ASSET_SYMBOLS = {"BTC": "BTCUSDT", "ETH": "ETHUSDT", "SOL": "SOLUSDT"}
-COINGECKO_ASSETS = {"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana"}
+ASSET_SYMBOLS = MappingProxyType({"BTC": "BTCUSDT", "ETH": "ETHUSDT", "SOL": "SOLUSDT"})
+COINGECKO_ASSETS = MappingProxyType({"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana"})
+
+# Resolved once for the configured asset rather than on every momentum fetch
+BINANCE_SYMBOL = ASSET_SYMBOLS.get(ASSET, f"{ASSET}USDT")
+COINGECKO_ID = COINGECKO_ASSETS.get(ASSET, ASSET.lower())
+
+def _binance_klines_url(symbol, lookback_minutes):
+    # One extra row: Binance always ends the list with the still-open candle, which is dropped
+    return f"https://api.binance.com/api/v3/klines?symbol={symbol}&interval=1m&limit={lookback_minutes + 1}"
+
+def _coingecko_price_query(asset):
+    return f"/api/v3/simple/price?ids={asset}&vs_currencies=usd"
+
+# Built once for the configured asset/lookback; other combinations go through the builders above
+BINANCE_KLINES_URL = _binance_klines_url(BINANCE_SYMBOL, LOOKBACK_MINUTES)
+COINGECKO_PRICE_QUERY = _coingecko_price_query(COINGECKO_ID)
 
 SIMMER_BASE = os.environ.get("SIMMER_API_BASE", "https://api.simmer.markets")
+COINGECKO_PRO_KEY = os.environ.get("COINGECKO_PRO_KEY")  # optional, used only when the free tier 429s
+BINANCE_WS_BASE = "wss://stream.binance.com:9443/ws"
+KLINE_STREAM_MAX_AGE = 30  # seconds of silence before the stream is treated as down
+BINANCE_BAN_DEFAULT = 60  # seconds to back off on 418/429 without a Retry-After header
+BINANCE_REST_TTL = 30  # ≤ half a 1m candle, so cached klines are never a full candle stale
+COINGECKO_TTL = 60  # free tier allows ~30 calls/min
+CYCLE_SECONDS = 60
+KEEPALIVE_PING_INTERVAL = 30  # well under Binance's ~60-90s HTTP idle timeout
+BINANCE_PING_URL = "https://api.binance.com/api/v3/ping"
+CANDLE_CLOSE_DELAY = 1.5  # seconds after the minute boundary, so Binance has published the closed candle
 
 # =============================================================================
 # API Helpers
@@ -68,83 +164,315 @@ def get_api_key():
         sys.exit(1)
     return key
 
+# Probe idle pooled sockets so NATs/load balancers don't silently drop them between
+# cycles, which would force a fresh DNS + TCP + TLS setup on the next request.
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _KEEPALIVE_SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4),
+    ]
+
+class _KeepAliveAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + _KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+def _build_session():
+    # One keep-alive pool per host: the TCP+TLS handshake is paid once, not per call.
+    # Retry only covers idempotent methods, so trade POSTs are never replayed. 429s are
+    # left to the caller (Binance ban window, CoinGecko pro fallback) rather than slept on.
+    session = requests.Session()
+    session.headers["User-Agent"] = "simmer-fastloop_market/1.0"
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                  raise_on_status=False)
+    session.mount("https://", _KeepAliveAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry))
+    return session
+
+_SESSION = _build_session()
+
 def _api_request(url, method="GET", data=None, headers=None, timeout=15):
     try:
-        req_headers = headers or {}
-        if "User-Agent" not in req_headers:
-            req_headers["User-Agent"] = "simmer-fastloop_market/1.0"
         body = None
         if data:
-            body = json.dumps(data).encode("utf-8")
-            req_headers["Content-Type"] = "application/json"
-        req = Request(url, data=body, headers=req_headers, method=method)
-        with urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except HTTPError as e:
-        try:
-            error_body = json.loads(e.read().decode("utf-8"))
-            return {"error": error_body.get("detail", str(e)), "status_code": e.code}
-        except Exception:
-            return {"error": str(e), "status_code": e.code}
-    except URLError as e:
-        return {"error": f"Connection error: {e.reason}"}
-    except Exception as e:
+            body = _json_dumps(data)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        resp = _SESSION.request(method, url, data=body, headers=headers, timeout=timeout)
+        if not resp.ok:
+            error = {"error": f"HTTP Error {resp.status_code}: {resp.reason}", "status_code": resp.status_code}
+            retry_after = resp.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                error["retry_after"] = int(retry_after)
+            try:
+                error["error"] = _json_loads(resp.content).get("detail", error["error"])
+            except (ValueError, AttributeError):
+                pass
+            return error
+        return _json_loads(resp.content)
+    except requests.exceptions.Timeout as e:
+        return {"error": f"Timeout: {e}"}
+    except requests.exceptions.ConnectionError as e:
+        return {"error": f"Connection error: {e}"}
+    except (requests.exceptions.RequestException, ValueError) as e:
         return {"error": str(e)}
 
+def _ok(result):
+    """True if an _api_request result is a usable payload rather than an error dict."""
+    return result is not None and not (isinstance(result, dict) and "error" in result)
+
+_TTL_CACHE = {}
+
+def _ttl_get(key, ttl, producer):
+    """Return the cached result for `key` if younger than `ttl` seconds, else call `producer`.
+    Error results are not cached, so a failed fetch is retried on the next call."""
+    now = time.monotonic()
+    hit = _TTL_CACHE.get(key)
+    if hit and now < hit[0]:
+        return hit[1]
+    val = producer()
+    if _ok(val):
+        # Prune expired entries so time-bucketed keys don't accumulate
+        for k in [k for k, (expires, _) in _TTL_CACHE.items() if expires <= now]:
+            del _TTL_CACHE[k]
+        _TTL_CACHE[key] = (now + ttl, val)
+    return val
+
 def simmer_request(path, method="GET", data=None, api_key=None):
     headers = {}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
     return _api_request(f"{SIMMER_BASE}{path}", method=method, data=data, headers=headers)
 
+def _start_keepalive_pinger(urls, interval=KEEPALIVE_PING_INTERVAL, skip=None):
+    """Ping `urls` every `interval` seconds on the shared session so their pooled
+    connections never idle out between cycles. Rounds where `skip()` is true are
+    passed over. Set the returned event to stop.
+
+    No lock is taken: the session is only read after setup and urllib3's pools are
+    thread-safe, so a slow ping never holds up the trading loop's requests."""
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            if skip and skip():
+                continue
+            for url in urls:
+                _api_request(url, timeout=5)
+
+    threading.Thread(target=run, name="keepalive-pinger", daemon=True).start()
+    return stop
+
+# =============================================================================
+# Binance Kline Stream
+# =============================================================================
+
+# symbol -> {"klines": deque of (open_time_ms, open, high, low, close, volume, closed), "updated": monotonic ts}
+_KLINE_STREAMS = {}
+_KLINE_LOCK = threading.Lock()
+_binance_banned_until = 0.0
+
+def _merge_klines(stream, klines):
+    # Keyed by open time so updates to the forming candle replace it in place. A candle
+    # the stream has finalized is never overwritten by a still-open copy, but a partial
+    # one (e.g. left over from a dropped connection) is always replaced.
+    with _KLINE_LOCK:
+        merged = {k[0]: k for k in stream["klines"]}
+        for k in klines:
+            current = merged.get(k[0])
+            if current is None or not current[6] or k[6]:
+                merged[k[0]] = k
+        stream["klines"].clear()
+        stream["klines"].extend(sorted(merged.values()))
+
+def _run_kline_stream(symbol, stream):
+    url = f"{BINANCE_WS_BASE}/{symbol.lower()}@kline_1m"
+    backoff = 1
+    while True:
+        try:
+            with ws_connect(url, open_timeout=10) as ws:
+                backoff = 1
+                while True:
+                    # The sync client has no keepalive pings before websockets 15, so a
+                    # half-open socket would block forever; Binance pushes every ~2s, and a
+                    # silent stretch this long means the connection is gone
+                    raw = ws.recv(timeout=KLINE_STREAM_MAX_AGE)
+                    k = _json_loads(raw).get("k")
+                    if not k:
+                        continue
+                    _merge_klines(stream, [(int(k["t"]), float(k["o"]), float(k["h"]),
+                                            float(k["l"]), float(k["c"]), float(k["v"]), bool(k["x"]))])
+                    stream["updated"] = time.monotonic()
+        except Exception as e:
+            log.warning("kline stream %s dropped: %s", symbol, e)
+        time.sleep(backoff)
+        backoff = min(backoff * 2, 60)
+
+def _ensure_kline_stream(symbol, lookback_minutes):
+    if not WS_AVAILABLE:
+        return
+    stream = _KLINE_STREAMS.get(symbol)
+    if stream is not None:
+        if stream["klines"].maxlen < lookback_minutes + 1:
+            # Sized to the largest lookback asked for, so every caller can be served
+            with _KLINE_LOCK:
+                stream["klines"] = deque(stream["klines"], maxlen=lookback_minutes + 1)
+        return
+    stream = {"klines": deque(maxlen=lookback_minutes + 1), "updated": 0.0}  # + the forming candle
+    _KLINE_STREAMS[symbol] = stream
+    threading.Thread(target=_run_kline_stream, args=(symbol, stream),
+                     name=f"kline-{symbol.lower()}", daemon=True).start()
+
+def _stream_klines(symbol, lookback_minutes):
+    """Latest `lookback_minutes` closed candles, ending with the one that closed at the
+    last minute boundary, or None if the stream isn't warm and live."""
+    stream = _KLINE_STREAMS.get(symbol)
+    if not stream:
+        return None
+    with _KLINE_LOCK:
+        if time.monotonic() - stream["updated"] > KLINE_STREAM_MAX_AGE:
+            return None
+        klines = [k for k in stream["klines"] if k[6]][-lookback_minutes:]
+    if len(klines) < lookback_minutes:
+        return None
+    if klines[-1][0] != int(time.time() // 60) * 60_000 - 60_000:
+        return None  # last minute's final update hasn't arrived yet
+    if klines[-1][0] - klines[0][0] != (lookback_minutes - 1) * 60_000:
+        return None  # gap from a reconnect, wait for it to fill
+    return klines
+
+def _binance_ping_idle():
+    """True while pinging Binance REST is pointless or harmful: during a rate-limit ban
+    (pings count against it and Binance escalates 418s) or while the stream is live."""
+    if time.monotonic() < _binance_banned_until:
+        return True
+    stream = _KLINE_STREAMS.get(BINANCE_SYMBOL)
+    return bool(stream) and time.monotonic() - stream["updated"] <= KLINE_STREAM_MAX_AGE
+
 # =============================================================================
 # Binance Momentum (Patched)
 # =============================================================================
 
+class MomentumError(Exception):
+    """A price source could not produce a momentum reading."""
+
+class NetworkError(MomentumError):
+    """The source was unreachable, rate-limited or returned an HTTP error."""
+
+class ParseError(MomentumError):
+    """The source answered, but not in the expected shape."""
+
+class EmptyDataError(MomentumError):
+    """The source answered correctly but with too little data for a signal."""
+
+@njit(cache=True, fastmath=True)
+def _reduce_momentum(candles):
+    """
+    Reduce [open, high, low, close, volume] rows to
+    (momentum_pct, volume, latest_volume, volume_ratio, high, low, vwap).
+    """
+    price_then = candles[0, 0]
+    price_now = candles[-1, 3]
+    n = candles.shape[0]
+    vol_sum = candles[:, 4].sum()  # one reduction feeds the mean, the ratio and the VWAP
+    latest_volume = candles[-1, 4]
+    volume_ratio = latest_volume * n / vol_sum if vol_sum > 0 else 1.0
+    vwap = (candles[:, 3] * candles[:, 4]).sum() / vol_sum if vol_sum > 0 else price_now
+    return ((price_now - price_then) / price_then * 100.0, vol_sum, latest_volume, volume_ratio,
+            candles[:, 1].max(), candles[:, 2].min(), vwap)
+
 def get_binance_momentum(symbol="BTCUSDT", lookback_minutes=5):
     """
-    Fetch Binance price candles and compute momentum.
-    Returns: dict with momentum_pct, direction, price_now, price_then, avg_volume, latest_volume, volume_ratio
+    Compute momentum from the Binance kline stream, or REST klines until the stream is warm.
+    Returns: dict with momentum_pct, direction, price_now, price_then, avg_volume, latest_volume, volume_ratio,
+             plus the window's open, high, low, close, volume and vwap
+    Raises: NetworkError, ParseError or EmptyDataError
     """
-    url = f"https://api.binance.com/api/v3/klines?symbol={symbol}&interval=1m&limit={lookback_minutes}"
-    result = _api_request(url)
-    if not result or isinstance(result, dict):
-        return None
-    try:
-        candles = result
-        if len(candles) < 2:
-            return None
-        price_then = float(candles[0][1])   # open of oldest candle
-        price_now = float(candles[-1][4])    # close of newest candle
-        momentum_pct = ((price_now - price_then) / price_then) * 100
-        direction = "up" if momentum_pct > 0 else "down"
-
-        volumes = [float(c[5]) for c in candles]
-        avg_volume = sum(volumes) / len(volumes) if volumes else 1.0
-        latest_volume = volumes[-1] if volumes else 1.0
-        volume_ratio = latest_volume / avg_volume if avg_volume > 0 else 1.0
-
-        return {
-            "momentum_pct": momentum_pct,
-            "direction": direction,
-            "price_now": price_now,
-            "price_then": price_then,
-            "avg_volume": avg_volume,
-            "latest_volume": latest_volume,
-            "volume_ratio": volume_ratio,
-            "candles": len(candles),
-        }
-    except (IndexError, ValueError, KeyError):
-        return None
+    global _binance_banned_until
+    _ensure_kline_stream(symbol, lookback_minutes)
+    klines = _stream_klines(symbol, lookback_minutes)
+    if klines is None:
+        if time.monotonic() < _binance_banned_until:
+            # hammering REST during a rate-limit ban only extends it
+            raise NetworkError("Binance REST paused for rate-limit ban")
+        if symbol == BINANCE_SYMBOL and lookback_minutes == LOOKBACK_MINUTES:
+            url = BINANCE_KLINES_URL
+        else:
+            url = _binance_klines_url(symbol, lookback_minutes)
+        now_ms = time.time() * 1000
+        # Keyed by minute too: a response cached before the boundary holds a partial candle
+        # that would pass for closed after it
+        result = _ttl_get(("binance", symbol, lookback_minutes, int(now_ms // 60_000)),
+                          BINANCE_REST_TTL, lambda: _api_request(url))
+        if isinstance(result, dict) and result.get("status_code") in (418, 429):
+            _binance_banned_until = time.monotonic() + result.get("retry_after", BINANCE_BAN_DEFAULT)
+        if not _ok(result):
+            raise NetworkError(result.get("error") if result else "no response")
+        if not isinstance(result, list):
+            raise ParseError(f"expected kline list, got {type(result).__name__}")
+        try:
+            # Binance sends prices as strings; let NumPy parse them straight into the array
+            # rather than allocating a Python float per field.
+            klines = np.array([c[:6] for c in result], dtype=np.float64)
+        except (IndexError, ValueError, TypeError) as e:
+            raise ParseError(f"malformed klines: {e}") from e
+        if len(klines) and (klines.ndim != 2 or klines.shape[1] != 6):
+            raise ParseError(f"malformed klines: expected rows of 6 fields, got shape {klines.shape}")
+        if symbol in _KLINE_STREAMS:
+            # Seed the stream so it is warm without waiting `lookback_minutes`; rows whose
+            # minute has passed are final and repair any partial candle left by a reconnect
+            _merge_klines(_KLINE_STREAMS[symbol],
+                          [(int(t), *ohlcv, t + 60_000 <= now_ms) for t, *ohlcv in klines.tolist()])
+        if len(klines):
+            # Only closed candles: the forming one holds a few seconds of volume at most
+            klines = klines[klines[:, 0] + 60_000 <= now_ms][-lookback_minutes:]
+    if len(klines) < 2:
+        raise EmptyDataError(f"{len(klines)} candle(s) for {symbol}, need at least 2")
+    candles = np.asarray(klines, dtype=np.float64)[:, 1:6]  # columns: open, high, low, close, volume
+
+    momentum_pct, volume, latest_volume, volume_ratio, high, low, vwap = (
+        float(x) for x in _reduce_momentum(candles))
+    price_then = float(candles[0, 0])   # open of oldest candle
+    price_now = float(candles[-1, 3])   # close of newest candle
+    direction = "up" if momentum_pct > 0 else "down"
+
+    return {
+        "momentum_pct": momentum_pct,
+        "direction": direction,
+        "price_now": price_now,
+        "price_then": price_then,
+        "avg_volume": volume / len(candles),
+        "latest_volume": latest_volume,
+        "volume_ratio": volume_ratio,
+        "candles": len(candles),
+        "open": price_then,
+        "high": high,
+        "low": low,
+        "close": price_now,
+        "volume": volume,
+        "vwap": vwap,
+    }
+
+def _fetch_coingecko_price(asset):
+    query = COINGECKO_PRICE_QUERY if asset == COINGECKO_ID else _coingecko_price_query(asset)
+    result = _api_request(f"https://api.coingecko.com{query}")
+    if COINGECKO_PRO_KEY and isinstance(result, dict) and result.get("status_code") == 429:
+        result = _api_request(f"https://pro-api.coingecko.com{query}",
+                              headers={"x-cg-pro-api-key": COINGECKO_PRO_KEY})
+    return result
 
 def get_coingecko_momentum(asset="bitcoin", lookback_minutes=5):
-    url = f"https://api.coingecko.com/api/v3/simple/price?ids={asset}&vs_currencies=usd"
-    result = _api_request(url)
-    if not result or isinstance(result, dict) and result.get("error"):
-        return None
-    price_now = result.get(asset, {}).get("usd")
+    result = _ttl_get(("coingecko", asset), COINGECKO_TTL, lambda: _fetch_coingecko_price(asset))
+    if not _ok(result):
+        raise NetworkError(result.get("error") if result else "no response")
+    if not isinstance(result, dict):
+        raise ParseError(f"expected price object, got {type(result).__name__}")
+    quote = result.get(asset) or {}
+    if not isinstance(quote, dict):
+        raise ParseError(f"expected price object for {asset}, got {type(quote).__name__}")
+    price_now = quote.get("usd")
     if not price_now:
-        return None
+        raise EmptyDataError(f"no USD price for {asset}")
     return {
         "momentum_pct": 0,
         "direction": "neutral",
@@ -154,17 +482,35 @@ def get_coingecko_momentum(asset="bitcoin", lookback_minutes=5):
         "latest_volume": 0,
         "volume_ratio": 1.0,
         "candles": 0,
+        "open": price_now,
+        "high": price_now,
+        "low": price_now,
+        "close": price_now,
+        "volume": 0,
+        "vwap": price_now,
     }
 
+_MOMENTUM_SOURCES = MappingProxyType({
+    "binance": lambda asset, lookback: get_binance_momentum(
+        BINANCE_SYMBOL if asset == ASSET else ASSET_SYMBOLS.get(asset, f"{asset}USDT"), lookback),
+    "coingecko": lambda asset, lookback: get_coingecko_momentum(
+        COINGECKO_ID if asset == ASSET else COINGECKO_ASSETS.get(asset, asset.lower()), lookback),
+})
+
 def get_momentum(asset="BTC", source="binance", lookback=5):
-    if source == "binance":
-        symbol = ASSET_SYMBOLS.get(asset, "BTCUSDT")
-        return get_binance_momentum(symbol, lookback)
-    elif source == "coingecko":
-        cg_id = COINGECKO_ASSETS.get(asset, "bitcoin")
-        return get_coingecko_momentum(cg_id, lookback)
-    else:
+    """Momentum dict from `source`, or None if it failed (the failure is logged by kind)."""
+    fetch = _MOMENTUM_SOURCES.get(source)
+    if not fetch:
         return None
+    try:
+        return fetch(asset, lookback)
+    except NetworkError as e:
+        log.warning("%s momentum unavailable: %s", source, e)
+    except ParseError as e:
+        log.error("%s returned malformed data: %s", source, e)
+    except EmptyDataError as e:
+        log.debug("%s returned no usable data: %s", source, e)
+    return None
 
 # =============================================================================
 # FastLoop Core Strategy (import, trade functions intact)
@@ -179,6 +525,43 @@ def get_momentum(asset="BTC", source="binance", lookback=5):
 # Railway Continuous Execution
 # =============================================================================
 
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """Evict the oldest queued record instead of blocking when the queue is full."""
+
+    def enqueue(self, record):
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # Block (rather than put_nowait) so stop() can't fail on a full queue;
+        # the listener thread is still draining it.
+        self.queue.put(self._sentinel)
+
+def _setup_logging(maxsize=1024):
+    # Records are written by a background listener, so a slow or back-pressured
+    # stdout pipe can never stall the trading cadence.
+    log_queue = queue.Queue(maxsize=maxsize)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = _DrainingQueueListener(log_queue, handler)
+    log.addHandler(_DropOldestQueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
+
+def _seconds_to_next_cycle():
+    """Seconds until CANDLE_CLOSE_DELAY past the next wall-clock cycle boundary."""
+    return (CYCLE_SECONDS - time.time() % CYCLE_SECONDS + CANDLE_CLOSE_DELAY) % CYCLE_SECONDS
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Simmer FastLoop Trading Skill (Railway-ready)")
     parser.add_argument("--live", action="store_true", help="Execute real trades (default dry-run)")
@@ -187,10 +570,19 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     dry_run = not args.live
+    _setup_logging()
+    if SIGNAL_SOURCE == "binance":
+        atexit.register(_start_keepalive_pinger([BINANCE_PING_URL], skip=_binance_ping_idle).set)
 
     print("🚀 Starting Simmer FastLoop Bot on Railway (Ctrl+C to stop)...")
 
+    # Lock the cadence to wall-clock minutes so each cycle starts just after a candle
+    # closes (momentum only uses closed candles), and schedule off a monotonic clock
+    # so run time doesn't add drift.
+    time.sleep(_seconds_to_next_cycle())
+    next_tick = time.monotonic()
     while True:
+        next_tick += CYCLE_SECONDS
         try:
             run_fast_market_strategy(
                 dry_run=dry_run,
@@ -199,6 +591,12 @@ if __name__ == "__main__":
                 smart_sizing=args.smart_sizing,
                 quiet=args.quiet
             )
-        except Exception as e:
-            print(f"❌ Error during run: {e}")
-        time.sleep(60)
+        except Exception:
+            log.exception("❌ Error during run")
+        sleep_for = next_tick - time.monotonic()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+        else:
+            # Fell behind: skip to the next aligned boundary rather than burst or drift off it
+            time.sleep(_seconds_to_next_cycle())
+            next_tick = time.monotonic()